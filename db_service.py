@@ -1,9 +1,49 @@
 import boto3
 import logging
+from botocore.config import Config
 from typing import Dict, Any
 
 logger = logging.getLogger()
 
+# Fail fast on stale connections and keep sockets alive between warm invocations
+_config = Config(
+    connect_timeout=5,
+    read_timeout=10,
+    tcp_keepalive=True,
+    retries={'max_attempts': 3, 'mode': 'adaptive'}
+)
+
+# Low-level client created once per container, during the Lambda init phase
+_client = boto3.client('dynamodb', config=_config)
+
+
+def _serialize_test_result(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the low-level DynamoDB attribute map for a test_results item."""
+    return {
+        'test_id': {'S': item['test_id']},
+        'user_id': {'S': item['user_id']},
+        'pushups_type': {'S': item['pushups_type']},
+        'max_push_ups': {'N': str(item['max_push_ups'])},
+        'max_squats': {'N': str(item['max_squats'])},
+        'max_reverse_snow_angels_45s': {'N': str(item['max_reverse_snow_angels_45s'])},
+        'plank_max_time_seconds': {'N': str(item['plank_max_time_seconds'])},
+        'mountain_climbers_45s': {'N': str(item['mountain_climbers_45s'])},
+        'created_at': {'S': item['created_at']}
+    }
+
+
+def _serialize_user_level(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the low-level DynamoDB attribute map for a user_levels item."""
+    return {
+        'user_level_id': {'S': item['user_level_id']},
+        'user_id': {'S': item['user_id']},
+        'test_id': {'S': item['test_id']},
+        'per_category': {'M': {category: {'S': level} for category, level in item['per_category'].items()}},
+        'global_level': {'S': item['global_level']},
+        'global_level_raw_avg_points': {'N': str(item['global_level_raw_avg_points'])},
+        'created_at': {'S': item['created_at']}
+    }
+
 
 class DynamoDBService:
     """Service class for DynamoDB operations."""
@@ -12,13 +52,12 @@ class DynamoDBService:
         """
         Initialize DynamoDB service.
 
+        All service instances share the module-level boto3 client.
+
         Args:
             test_results_table: Name of the test results DynamoDB table
             user_levels_table: Name of the user levels DynamoDB table
         """
-        self.dynamodb = boto3.resource('dynamodb')
-        self.test_results_table = self.dynamodb.Table(test_results_table)
-        self.user_levels_table = self.dynamodb.Table(user_levels_table)
         self.test_results_table_name = test_results_table
         self.user_levels_table_name = user_levels_table
 
@@ -33,9 +72,8 @@ class DynamoDBService:
             Exception: If the put operation fails
         """
         try:
-            response = self.test_results_table.put_item(Item=item)
-            logger.info(f"Successfully wrote test result to table {self.test_results_table_name}")
-            logger.debug(f"DynamoDB response: {response}")
+            response = _client.put_item(TableName=self.test_results_table_name, Item=_serialize_test_result(item))
+            logger.debug("DynamoDB response: %s", response)
         except Exception as e:
             logger.error(f"Failed to write test result to DynamoDB: {str(e)}")
             raise
@@ -51,9 +89,34 @@ class DynamoDBService:
             Exception: If the put operation fails
         """
         try:
-            response = self.user_levels_table.put_item(Item=item)
-            logger.info(f"Successfully wrote user levels to table {self.user_levels_table_name}")
-            logger.debug(f"DynamoDB response: {response}")
+            response = _client.put_item(TableName=self.user_levels_table_name, Item=_serialize_user_level(item))
+            logger.debug("DynamoDB response: %s", response)
         except Exception as e:
             logger.error(f"Failed to write user levels to DynamoDB: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    def put_test_and_user_level(self, test_item: Dict[str, Any], level_item: Dict[str, Any]) -> None:
+        """
+        Store a test result and its user levels in a single DynamoDB transaction.
+
+        Both items are written atomically with one TransactWriteItems call,
+        saving a network round trip compared to two separate puts.
+
+        Args:
+            test_item: Dictionary containing the test result to store
+            level_item: Dictionary containing the user levels to store
+
+        Raises:
+            Exception: If the transaction fails
+        """
+        try:
+            response = _client.transact_write_items(
+                TransactItems=[
+                    {'Put': {'TableName': self.test_results_table_name, 'Item': _serialize_test_result(test_item)}},
+                    {'Put': {'TableName': self.user_levels_table_name, 'Item': _serialize_user_level(level_item)}}
+                ]
+            )
+            logger.debug("DynamoDB response: %s", response)
+        except Exception as e:
+            logger.error(f"Failed to write test result and user levels to DynamoDB: {str(e)}")
+            raise
@@ -3,28 +3,44 @@ import logging
 import os
 from datetime import datetime
 from decimal import Decimal
-from uuid import uuid4
+from uuid import UUID
 
 from db_service import DynamoDBService
 from validator import validate_fitness_test_request
-from level_calculator import TestResults, compute_levels
+from level_calculator import compute_levels_from_mapping
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the stdlib json module when it is not bundled
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+else:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, default=str).decode()
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# Module-level db_service variable for caching
-_db_service = None
+# The raw average is always a points total of 5..15 divided by the 5 categories,
+# computed as total / 5 exactly like _summarize_levels does, so every average
+# is a key here and its DynamoDB Decimal representation is built once up front
+_AVG_POINTS_DECIMALS = {total / 5: Decimal(str(total / 5)) for total in range(5, 16)}
 
+# Fixed error bodies, serialized once at import; each response dict is built
+# per call so callers can safely add headers or otherwise modify it
+_MISSING_BODY_JSON = _json_dumps({'error': 'Missing request body'})
+_INVALID_JSON_JSON = _json_dumps({'error': 'Invalid JSON in request body'})
+_INTERNAL_ERROR_JSON = _json_dumps({'error': 'Internal server error'})
 
-def get_db_service():
-    """Get or create the DynamoDB service instance."""
-    global _db_service
-    if _db_service is None:
-        test_results_table = os.environ.get('DYNAMODB_TABLE_NAME', 'test_results')
-        user_levels_table = os.environ.get('USER_LEVELS_TABLE_NAME', 'user_levels')
-        _db_service = DynamoDBService(test_results_table, user_levels_table)
-    return _db_service
+# DynamoDB service created once per container, during the Lambda init phase
+_db_service = DynamoDBService(
+    os.environ.get('DYNAMODB_TABLE_NAME', 'test_results'),
+    os.environ.get('USER_LEVELS_TABLE_NAME', 'user_levels')
+)
 
 
 def lambda_handler(event, context):
@@ -45,18 +61,20 @@ def lambda_handler(event, context):
     }
     """
     try:
-        # Log incoming request
-        logger.info(f"Received event: {json.dumps(event)}")
-
-        # Parse request body
-        if 'body' not in event:
+        # Log a short summary of the request; the full event is only
+        # serialized when DEBUG logging is enabled
+        logger.info("Received %s request for %s", event.get('httpMethod'), event.get('path'))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received event: %s", _json_dumps(event))
+
+        # Parse request body; API Gateway sends None when the request has no body
+        raw_body = event.get('body')
+        if raw_body is None:
             logger.error("Missing request body")
-            return {
-                'statusCode': 400,
-                'body': json.dumps({'error': 'Missing request body'})
-            }
+            return {'statusCode': 400, 'body': _MISSING_BODY_JSON}
 
-        body = json.loads(event['body']) if isinstance(event['body'], str) else event['body']
+        # Proxy integrations always send a string; direct invocations may pass a dict
+        body = _json_loads(raw_body) if type(raw_body) is str else raw_body
 
         # Validate request
         is_valid, error_message = validate_fitness_test_request(body)
@@ -64,12 +82,15 @@ def lambda_handler(event, context):
             logger.error(f"Validation error: {error_message}")
             return {
                 'statusCode': 400,
-                'body': json.dumps({'error': error_message})
+                'body': _json_dumps({'error': error_message})
             }
 
-        # Generate test_id and user_levels_id
-        test_id = str(uuid4())
-        user_levels_id = str(uuid4())
+        # Generate test_id and user_level_id as UUID4 hex strings from a single
+        # urandom call; both rows share one creation timestamp
+        raw = os.urandom(32)
+        test_id = UUID(bytes=raw[:16], version=4).hex
+        user_level_id = UUID(bytes=raw[16:], version=4).hex
+        created_at = datetime.utcnow().isoformat()
 
         # Prepare test result item for DynamoDB
         test_result_item = {
@@ -81,62 +102,48 @@ def lambda_handler(event, context):
             'max_reverse_snow_angels_45s': body['results']['max_reverse_snow_angels_45s'],
             'plank_max_time_seconds': body['results']['plank_max_time_seconds'],
             'mountain_climbers_45s': body['results']['mountain_climbers_45s'],
-            'created_at': datetime.utcnow().isoformat()
+            'created_at': created_at
         }
 
-        # Calculate fitness levels
-        test_results = TestResults(
-            max_squats=body['results']['max_squats'],
-            pushups_type=body['pushups_type'],
-            max_push_ups=body['results']['max_push_ups'],
-            max_reverse_snow_angels_45s=body['results']['max_reverse_snow_angels_45s'],
-            plank_max_time_seconds=body['results']['plank_max_time_seconds'],
-            mountain_climbers_45s=body['results']['mountain_climbers_45s']
-        )
-        calculated_levels = compute_levels(test_results)
-
-        # Prepare user levels item for DynamoDB (convert float to Decimal for DynamoDB)
+        # Calculate fitness levels directly from the parsed request
+        calculated_levels = compute_levels_from_mapping(body['results'], body['pushups_type'])
+
+        # Prepare user levels item for DynamoDB (DynamoDB needs Decimal instead of float)
+        avg_points = calculated_levels['global_level_raw_avg_points']
         user_level_item = {
-            'user_levels_id': user_levels_id,
+            'user_level_id': user_level_id,
             'user_id': body['user_id'],
             'test_id': test_id,
             'per_category': calculated_levels['per_category'],
             'global_level': calculated_levels['global_level'],
-            'global_level_raw_avg_points': Decimal(str(calculated_levels['global_level_raw_avg_points'])),
-            'created_at': datetime.utcnow().isoformat()
+            'global_level_raw_avg_points': _AVG_POINTS_DECIMALS[avg_points],
+            'created_at': created_at
         }
 
-        # Store both items in DynamoDB
-        db_service = get_db_service()
-        db_service.put_test_result(test_result_item)
-        db_service.put_user_level(user_level_item)
+        # Store both items in DynamoDB in a single transaction
+        _db_service.put_test_and_user_level(test_result_item, user_level_item)
 
-        # Log success
-        logger.info(f"Successfully stored test result with test_id: {test_id}")
-        logger.info(f"Successfully stored user levels with user_levels_id: {user_levels_id}")
+        # Log success once for both stored items
+        logger.info("Successfully stored test_id=%s user_level_id=%s", test_id, user_level_id)
 
         # Return calculated levels in JSON format
         response_body = {
-            'user_levels_id': user_levels_id,
+            'user_level_id': user_level_id,
             'test_id': test_id,
             'levels': calculated_levels
         }
 
         return {
             'statusCode': 200,
-            'body': json.dumps(response_body)
+            'body': _json_dumps(response_body)
         }
 
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
         logger.error(f"JSON decode error: {str(e)}")
-        return {
-            'statusCode': 400,
-            'body': json.dumps({'error': 'Invalid JSON in request body'})
-        }
+        return {'statusCode': 400, 'body': _INVALID_JSON_JSON}
 
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
-        return {
-            'statusCode': 500,
-            'body': json.dumps({'error': 'Internal server error'})
-        }
\ No newline at end of file
+        # Tracebacks are only formatted when DEBUG logging is enabled
+        logger.error("Unexpected error: %s", e)
+        logger.debug("Unexpected error traceback", exc_info=True)
+        return {'statusCode': 500, 'body': _INTERNAL_ERROR_JSON}
\ No newline at end of file
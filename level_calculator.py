@@ -1,21 +1,16 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
-from enum import Enum
-from typing import Any, Dict, Optional
+from enum import IntEnum
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
 
-class Level(str, Enum):
-    BEGINNER = "BEGINNER"
-    INTERMEDIATE = "INTERMEDIATE"
-    ADVANCED = "ADVANCED"
-
-
-LEVEL_POINTS = {
-    Level.BEGINNER: 1,
-    Level.INTERMEDIATE: 2,
-    Level.ADVANCED: 3,
-}
+class Level(IntEnum):
+    """Fitness level; the integer value is the level's point score."""
+    BEGINNER = 1
+    INTERMEDIATE = 2
+    ADVANCED = 3
 
 
 @dataclass(frozen=True)
@@ -37,44 +32,47 @@ class TestResults:
     mountain_climbers_45s: int
 
 
-def _clamp_int(x: int, lo: int = 0) -> int:
-    return x if x >= lo else lo
+# Category thresholds: a value below thresholds[0] is BEGINNER, below
+# thresholds[1] is INTERMEDIATE, anything else is ADVANCED.
+_THRESHOLDS = {
+    "LOWER": (21, 41),    # squats: <=20 beginner, <=40 intermediate
+    "PULL": (11, 21),     # reverse snow angels: <=10 beginner, <=20 intermediate
+    "CORE": (30.0, 75.0),  # plank seconds: <30 beginner, <75 intermediate
+    "COND": (30, 61),     # mountain climbers: <30 beginner, <=60 intermediate
+}
+
+_LEVELS = (Level.BEGINNER, Level.INTERMEDIATE, Level.ADVANCED)
+
+
+def _classify(value: float, thresholds: Tuple[float, float]) -> Level:
+    # Clamp to 0 so negative values and NaN (for which every comparison is
+    # false) classify as BEGINNER
+    return _LEVELS[bisect_right(thresholds, value if value > 0 else 0)]
 
 
 def level_lower_from_squats(squats_60s: int) -> Level:
-    reps = _clamp_int(int(squats_60s))
-    if reps <= 20:
-        return Level.BEGINNER
-    if reps <= 40:
-        return Level.INTERMEDIATE
-    return Level.ADVANCED
+    return _classify(int(squats_60s), _THRESHOLDS["LOWER"])
 
 
 def level_pull_from_reverse_snow_angels(reps_45s: int) -> Level:
-    reps = _clamp_int(int(reps_45s))
-    if reps <= 10:
-        return Level.BEGINNER
-    if reps <= 20:
-        return Level.INTERMEDIATE
-    return Level.ADVANCED
+    return _classify(int(reps_45s), _THRESHOLDS["PULL"])
 
 
 def level_core_from_plank(seconds: float) -> Level:
-    sec = max(0.0, float(seconds))
-    if sec < 30.0:
-        return Level.BEGINNER
-    if sec < 75.0:
-        return Level.INTERMEDIATE
-    return Level.ADVANCED
+    return _classify(float(seconds), _THRESHOLDS["CORE"])
 
 
 def level_cond_from_mountain_climbers(reps_45s: int) -> Level:
-    reps = _clamp_int(int(reps_45s))
-    if reps < 30:
-        return Level.BEGINNER
-    if reps <= 60:
-        return Level.INTERMEDIATE
-    return Level.ADVANCED
+    return _classify(int(reps_45s), _THRESHOLDS["COND"])
+
+
+# Push-up level by variant, for reps >= 1
+_PUSH_LEVELS: Dict[str, Callable[[int], Level]] = {
+    "wall": lambda reps: Level.BEGINNER,
+    "incline": lambda reps: Level.BEGINNER,
+    "knee": lambda reps: Level.INTERMEDIATE,
+    "classic": lambda reps: Level.ADVANCED if reps >= 11 else Level.INTERMEDIATE,
+}
 
 
 def level_push_from_pushups(pushups_type: str, max_push_ups: int) -> Level:
@@ -90,27 +88,21 @@ def level_push_from_pushups(pushups_type: str, max_push_ups: int) -> Level:
         pushups_type: one of "wall", "incline", "knee", "classic"
         max_push_ups: number of reps (integer >= 0)
     """
-    variant = (pushups_type or "").strip().lower()
-    reps = _clamp_int(int(max_push_ups))
+    reps = int(max_push_ups)
 
-    if reps == 0:
+    if reps <= 0:
         return Level.BEGINNER
 
-    if variant in {"wall", "incline"}:
-        return Level.BEGINNER
-    if variant == "knee":
-        return Level.INTERMEDIATE
-    if variant == "classic":
-        return Level.ADVANCED if reps >= 11 else Level.INTERMEDIATE
-
-    raise ValueError(
-        f"Invalid push-up variant '{pushups_type}'. Expected one of: wall, incline, knee, classic."
-    )
-
-
-def _round_half_up(x: float) -> int:
-    # round-half-up for positives (we only use positive domain here)
-    return int(x + 0.5)
+    # Validated requests already use the canonical variant name, so only
+    # normalize the string when the direct lookup misses
+    level_for_reps = _PUSH_LEVELS.get(pushups_type)
+    if level_for_reps is None:
+        level_for_reps = _PUSH_LEVELS.get((pushups_type or "").strip().lower())
+        if level_for_reps is None:
+            raise ValueError(
+                f"Invalid push-up variant '{pushups_type}'. Expected one of: wall, incline, knee, classic."
+            )
+    return level_for_reps(reps)
 
 
 def compute_levels(results: TestResults) -> Dict[str, Any]:
@@ -137,30 +129,60 @@ def compute_levels(results: TestResults) -> Dict[str, Any]:
       If there is at least one BEGINNER and at least one ADVANCED among category levels,
       cap the Global Fitness Level to INTERMEDIATE.
     """
+    return compute_levels_from_mapping(vars(results), results.pushups_type)
+
+
+def compute_levels_from_mapping(results: Mapping[str, Any], pushups_type: str) -> Dict[str, Any]:
+    """
+    Computes fitness levels straight from a request's results mapping.
+
+    compute_levels delegates here, so the handler can pass the already-parsed
+    request dict without building a TestResults instance.
+
+    Args:
+        results: Mapping with the five exercise result fields
+        pushups_type: one of "wall", "incline", "knee", "classic"
+
+    Returns:
+        Same structure as compute_levels.
+    """
     per_category: Dict[str, Level] = {
-        "LOWER": level_lower_from_squats(results.max_squats),
-        "PUSH": level_push_from_pushups(results.pushups_type, results.max_push_ups),
-        "PULL": level_pull_from_reverse_snow_angels(results.max_reverse_snow_angels_45s),
-        "CORE": level_core_from_plank(results.plank_max_time_seconds),
-        "COND": level_cond_from_mountain_climbers(results.mountain_climbers_45s),
+        "LOWER": level_lower_from_squats(results["max_squats"]),
+        "PUSH": level_push_from_pushups(pushups_type, results["max_push_ups"]),
+        "PULL": level_pull_from_reverse_snow_angels(results["max_reverse_snow_angels_45s"]),
+        "CORE": level_core_from_plank(results["plank_max_time_seconds"]),
+        "COND": level_cond_from_mountain_climbers(results["mountain_climbers_45s"]),
     }
+    return _summarize_levels(per_category)
 
-    points = [LEVEL_POINTS[lvl] for lvl in per_category.values()]
-    avg_points = sum(points) / len(points)
 
-    # Map average points back to level using round-to-nearest (half-up)
-    rounded = _round_half_up(avg_points)  # 1..3
-    rounded = max(1, min(3, rounded))
-    global_level = {1: Level.BEGINNER, 2: Level.INTERMEDIATE, 3: Level.ADVANCED}[rounded]
+def _summarize_levels(per_category: Dict[str, Level]) -> Dict[str, Any]:
+    # Single pass: accumulate points and detect BEGINNER/ADVANCED together
+    total = 0
+    has_beginner = has_advanced = False
+    for lvl in per_category.values():
+        total += lvl
+        has_beginner |= lvl == 1
+        has_advanced |= lvl == 3
+    count = len(per_category)
+    avg_points = total / count
 
-    # Corrective rule: prevent extreme mismatch (BEGINNER + ADVANCED) from producing ADVANCED globally
-    has_beginner = any(lvl == Level.BEGINNER for lvl in per_category.values())
-    has_advanced = any(lvl == Level.ADVANCED for lvl in per_category.values())
     if has_beginner and has_advanced:
+        # Corrective rule: prevent extreme mismatch (BEGINNER + ADVANCED) from producing ADVANCED globally
         global_level = Level.INTERMEDIATE
+    elif total % count == 0:
+        # Without both extremes, a whole-number average means every category
+        # has the same level, so it is the global level as-is
+        global_level = _LEVELS[total // count - 1]
+    else:
+        # Map average points back to level using round-to-nearest (half-up),
+        # computed in integers: floor(total / count + 0.5). The total lies in
+        # [count, 3 * count], so the result is always 1..3.
+        rounded = (2 * total + count) // (2 * count)
+        global_level = _LEVELS[rounded - 1]
 
     return {
-        "per_category": {k: v.value for k, v in per_category.items()},
-        "global_level": global_level.value,
+        "per_category": {k: v.name for k, v in per_category.items()},
+        "global_level": global_level.name,
         "global_level_raw_avg_points": avg_points,
     }
@@ -0,0 +1,23 @@
+"""Request payloads shared by the validator and handler tests."""
+import copy
+
+VALID_RESULTS = {
+    "max_push_ups": 50,
+    "max_squats": 100,
+    "max_reverse_snow_angels_45s": 30,
+    "plank_max_time_seconds": 120,
+    "mountain_climbers_45s": 80
+}
+
+VALID_PAYLOAD = {
+    "user_id": "user123",
+    "pushups_type": "classic",
+    "results": VALID_RESULTS
+}
+
+
+def mutated_payload(mutate):
+    """Return a copy of the valid payload changed by mutate."""
+    payload = copy.deepcopy(VALID_PAYLOAD)
+    mutate(payload)
+    return payload
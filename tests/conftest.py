@@ -0,0 +1,82 @@
+import boto3
+import pytest
+from moto import mock_aws
+
+
+_aws_env = pytest.MonkeyPatch()
+
+
+def pytest_configure(config):
+    """Set fake AWS credentials and region before any test module is imported.
+
+    db_service creates its boto3 client at import time, so these must be in
+    place before collection rather than in a fixture.
+    """
+    _aws_env.setenv('AWS_ACCESS_KEY_ID', 'testing')
+    _aws_env.setenv('AWS_SECRET_ACCESS_KEY', 'testing')
+    _aws_env.setenv('AWS_SECURITY_TOKEN', 'testing')
+    _aws_env.setenv('AWS_SESSION_TOKEN', 'testing')
+    _aws_env.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+
+
+def pytest_unconfigure(config):
+    """Restore the original AWS environment at the end of the run."""
+    _aws_env.undo()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _moto():
+    """Start the moto mock once for the whole test session, so no test can reach AWS."""
+    mock = mock_aws()
+    mock.start()
+    yield
+    mock.stop()
+
+
+@pytest.fixture(scope="session")
+def _session_tables(_moto):
+    """Create mock DynamoDB tables once per session."""
+    dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
+
+    # Create test_results table
+    test_results_table = dynamodb.create_table(
+        TableName='test-fitness-results',
+        KeySchema=[
+            {'AttributeName': 'test_id', 'KeyType': 'HASH'}
+        ],
+        AttributeDefinitions=[
+            {'AttributeName': 'test_id', 'AttributeType': 'S'}
+        ],
+        BillingMode='PAY_PER_REQUEST'
+    )
+
+    # Create user_levels table
+    user_levels_table = dynamodb.create_table(
+        TableName='test-user-levels',
+        KeySchema=[
+            {'AttributeName': 'user_level_id', 'KeyType': 'HASH'}
+        ],
+        AttributeDefinitions=[
+            {'AttributeName': 'user_level_id', 'AttributeType': 'S'}
+        ],
+        BillingMode='PAY_PER_REQUEST'
+    )
+
+    yield {
+        'test_results': test_results_table,
+        'user_levels': user_levels_table
+    }
+
+
+@pytest.fixture
+def dynamodb_tables(_session_tables):
+    """Provide the session tables and remove the items each test wrote."""
+    yield _session_tables
+
+    # Only fetch the key attribute and delete in BatchWriteItem calls of up to 25 items
+    for key, table in (('test_id', _session_tables['test_results']),
+                       ('user_level_id', _session_tables['user_levels'])):
+        keys = table.scan(ProjectionExpression=key)['Items']
+        with table.batch_writer() as batch:
+            for item in keys:
+                batch.delete_item(Key=item)
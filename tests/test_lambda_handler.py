@@ -1,97 +1,79 @@
 import pytest
+import importlib
 import json
-import os
-from unittest.mock import Mock
-from moto import mock_aws
-import boto3
+import logging
+import sys
+from decimal import Decimal
+from types import SimpleNamespace
+from db_service import DynamoDBService
+import lambda_handler as _lh
 from lambda_handler import lambda_handler
+from tests._payloads import VALID_PAYLOAD, mutated_payload
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+# Lambda context stand-in; the handler never inspects it
+_CTX = SimpleNamespace(function_name="test", aws_request_id="test")
+
+# Serialized request bodies shared by the success-path tests
+_VALID_BODY = json.dumps(VALID_PAYLOAD)
+_ZERO_VALUES_BODY = json.dumps(mutated_payload(lambda p: p.update(results=dict.fromkeys(p['results'], 0))))
+
+
+def _mutated_event(mutate):
+    """Build an API Gateway event from a copy of the valid payload changed by mutate."""
+    return {'body': json.dumps(mutated_payload(mutate))}
 
 
 class TestLambdaHandler:
     """Tests for the Lambda handler."""
 
     @pytest.fixture
-    def aws_credentials(self):
-        """Mock AWS credentials for moto."""
-        os.environ['AWS_ACCESS_KEY_ID'] = 'testing'
-        os.environ['AWS_SECRET_ACCESS_KEY'] = 'testing'
-        os.environ['AWS_SECURITY_TOKEN'] = 'testing'
-        os.environ['AWS_SESSION_TOKEN'] = 'testing'
-        os.environ['AWS_DEFAULT_REGION'] = 'us-east-1'
-        os.environ['DYNAMODB_TABLE_NAME'] = 'test-fitness-results'
-        os.environ['USER_LEVELS_TABLE_NAME'] = 'test-user-levels'
-
-        # Reset the cached db_service between tests
-        import lambda_handler as lh
-        lh._db_service = None
-        yield
-        lh._db_service = None
+    def db_service(self, monkeypatch):
+        """Point the module-level db_service at the test tables; reverted after the test."""
+        monkeypatch.setattr(_lh, '_db_service', DynamoDBService('test-fitness-results', 'test-user-levels'))
+
+    @pytest.fixture
+    def no_db(self, monkeypatch):
+        """Stub out DynamoDB for tests that must never reach storage; returns recorded writes."""
+        writes = []
+        stub = SimpleNamespace(put_test_and_user_level=lambda *items: writes.append(items))
+        monkeypatch.setattr(_lh, '_db_service', stub)
+        return writes
 
     @pytest.fixture
-    def dynamodb_tables(self, aws_credentials):
-        """Create mock DynamoDB tables."""
-        with mock_aws():
-            dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
-
-            # Create test_results table
-            test_results_table = dynamodb.create_table(
-                TableName='test-fitness-results',
-                KeySchema=[
-                    {'AttributeName': 'test_id', 'KeyType': 'HASH'}
-                ],
-                AttributeDefinitions=[
-                    {'AttributeName': 'test_id', 'AttributeType': 'S'}
-                ],
-                BillingMode='PAY_PER_REQUEST'
-            )
-
-            # Create user_levels table
-            user_levels_table = dynamodb.create_table(
-                TableName='test-user-levels',
-                KeySchema=[
-                    {'AttributeName': 'user_level_id', 'KeyType': 'HASH'}
-                ],
-                AttributeDefinitions=[
-                    {'AttributeName': 'user_level_id', 'AttributeType': 'S'}
-                ],
-                BillingMode='PAY_PER_REQUEST'
-            )
-
-            yield {
-                'test_results': test_results_table,
-                'user_levels': user_levels_table
-            }
-
-    @mock_aws
-    def test_successful_request(self, aws_credentials, dynamodb_tables):
+    def stdlib_json(self):
+        """Reload the handler with orjson hidden, as in the deployed package; restored afterwards."""
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setitem(sys.modules, 'orjson', None)
+            importlib.reload(_lh)
+            yield
+        importlib.reload(_lh)
+
+    def test_successful_request(self, db_service, dynamodb_tables):
         """Test a successful fitness test submission."""
-        event = {
-            'body': json.dumps({
-                "user_id": "user123",
-                "pushups_type": "classic",
-                "results": {
-                    "max_push_ups": 50,
-                    "max_squats": 100,
-                    "max_reverse_snow_angels_45s": 30,
-                    "plank_max_time_seconds": 120,
-                    "mountain_climbers_45s": 80
-                }
-            })
-        }
-        context = Mock()
-
-        response = lambda_handler(event, context)
+        event = {'body': _VALID_BODY}
+        response = lambda_handler(event, _CTX)
 
         assert response['statusCode'] == 200
 
         # Parse response body
-        response_body = json.loads(response['body'])
+        response_body = json_loads(response['body'])
 
         # Verify response structure
         assert 'user_level_id' in response_body
         assert 'test_id' in response_body
         assert 'levels' in response_body
 
+        # IDs are distinct UUID4 hex strings
+        assert len(response_body['test_id']) == 32
+        assert len(response_body['user_level_id']) == 32
+        assert response_body['test_id'] != response_body['user_level_id']
+
         # Verify levels structure
         levels = response_body['levels']
         assert 'per_category' in levels
@@ -106,165 +88,73 @@ class TestLambdaHandler:
         assert levels['per_category']['COND'] == 'ADVANCED'   # 80 climbers
         assert levels['global_level'] == 'ADVANCED'
 
-    def test_missing_body(self):
-        """Test request without body."""
-        event = {}
-        context = Mock()
-
-        response = lambda_handler(event, context)
-
-        assert response['statusCode'] == 400
-        body = json.loads(response['body'])
-        assert 'error' in body
-        assert 'body' in body['error'].lower()
-
-    def test_invalid_json(self):
-        """Test request with invalid JSON."""
-        event = {
-            'body': 'not-valid-json{'
-        }
-        context = Mock()
-
-        response = lambda_handler(event, context)
-
-        assert response['statusCode'] == 400
-        body = json.loads(response['body'])
-        assert 'error' in body
-        assert 'JSON' in body['error']
-
-    def test_missing_user_id(self):
-        """Test request without user_id."""
-        event = {
-            'body': json.dumps({
-                "pushups_type": "classic",
-                "results": {
-                    "max_push_ups": 50,
-                    "max_squats": 100,
-                    "max_reverse_snow_angels_45s": 30,
-                    "plank_max_time_seconds": 120,
-                    "mountain_climbers_45s": 80
-                }
-            })
-        }
-        context = Mock()
-
-        response = lambda_handler(event, context)
+        # Verify the stored levels use a Decimal average
+        stored = dynamodb_tables['user_levels'].get_item(
+            Key={'user_level_id': response_body['user_level_id']}
+        )['Item']
+        assert stored['test_id'] == response_body['test_id']
+        assert stored['global_level_raw_avg_points'] == Decimal('3.0')
+
+    @pytest.mark.parametrize("event,err_substr", [
+        ({}, 'body'),
+        ({'body': None}, 'body'),
+        ({'body': 'not-valid-json{'}, 'JSON'),
+        (_mutated_event(lambda p: p.pop('user_id')), 'user_id'),
+        (_mutated_event(lambda p: p.pop('results')), 'results'),
+        (_mutated_event(lambda p: p.pop('pushups_type')), 'pushups_type'),
+        (_mutated_event(lambda p: p.update(pushups_type='invalid_type')), 'pushups_type'),
+        (_mutated_event(lambda p: p['results'].pop('mountain_climbers_45s')), 'mountain_climbers_45s'),
+        (_mutated_event(lambda p: p['results'].update(max_push_ups=-10)), 'non-negative'),
+    ], ids=[
+        'missing_body',
+        'null_body',
+        'invalid_json',
+        'missing_user_id',
+        'missing_results',
+        'missing_pushups_type',
+        'invalid_pushups_type',
+        'missing_exercise_field',
+        'negative_exercise_value',
+    ])
+    def test_invalid_request(self, no_db, event, err_substr):
+        """Test that invalid requests are rejected with a 400 and a descriptive error."""
+        response = lambda_handler(event, _CTX)
 
         assert response['statusCode'] == 400
-        body = json.loads(response['body'])
+        body = json_loads(response['body'])
         assert 'error' in body
-        assert 'user_id' in body['error']
+        assert err_substr in body['error']
+        assert no_db == []
 
-    def test_missing_results(self):
-        """Test request without results."""
-        event = {
-            'body': json.dumps({
-                "user_id": "user123",
-                "pushups_type": "classic"
-            })
-        }
-        context = Mock()
+    def test_unexpected_error(self, monkeypatch, caplog):
+        """Test that a storage failure returns a 500 and logs no traceback at ERROR."""
+        def fail(*items):
+            raise RuntimeError("boom")
+        monkeypatch.setattr(_lh, '_db_service', SimpleNamespace(put_test_and_user_level=fail))
 
-        response = lambda_handler(event, context)
+        response = lambda_handler({'body': _VALID_BODY}, _CTX)
 
-        assert response['statusCode'] == 400
-        body = json.loads(response['body'])
-        assert 'error' in body
-        assert 'results' in body['error']
-
-    def test_missing_exercise_field(self):
-        """Test request with missing exercise result."""
-        event = {
-            'body': json.dumps({
-                "user_id": "user123",
-                "pushups_type": "classic",
-                "results": {
-                    "max_push_ups": 50,
-                    "max_squats": 100,
-                    "max_reverse_snow_angels_45s": 30,
-                    "plank_max_time_seconds": 120
-                    # mountain_climbers_45s is missing
-                }
-            })
-        }
-        context = Mock()
-
-        response = lambda_handler(event, context)
-
-        assert response['statusCode'] == 400
-        body = json.loads(response['body'])
-        assert 'error' in body
-        assert 'mountain_climbers_45s' in body['error']
-
-    def test_negative_exercise_value(self):
-        """Test request with negative exercise value."""
-        event = {
-            'body': json.dumps({
-                "user_id": "user123",
-                "pushups_type": "classic",
-                "results": {
-                    "max_push_ups": -10,
-                    "max_squats": 100,
-                    "max_reverse_snow_angels_45s": 30,
-                    "plank_max_time_seconds": 120,
-                    "mountain_climbers_45s": 80
-                }
-            })
-        }
-        context = Mock()
-
-        response = lambda_handler(event, context)
-
-        assert response['statusCode'] == 400
-        body = json.loads(response['body'])
-        assert 'error' in body
+        assert response == {'statusCode': 500, 'body': _lh._INTERNAL_ERROR_JSON}
+        errors = [r for r in caplog.records if r.levelno >= logging.ERROR]
+        assert [r.getMessage() for r in errors] == ["Unexpected error: boom"]
+        assert errors[0].exc_info is None
 
-    @mock_aws
-    def test_body_as_dict(self, aws_credentials, dynamodb_tables):
+    def test_body_as_dict(self, db_service, dynamodb_tables):
         """Test request where body is already a dict (not stringified)."""
-        event = {
-            'body': {
-                "user_id": "user123",
-                "pushups_type": "classic",
-                "results": {
-                    "max_push_ups": 50,
-                    "max_squats": 100,
-                    "max_reverse_snow_angels_45s": 30,
-                    "plank_max_time_seconds": 120,
-                    "mountain_climbers_45s": 80
-                }
-            }
-        }
-        context = Mock()
-
-        response = lambda_handler(event, context)
+        event = {'body': VALID_PAYLOAD}
+        response = lambda_handler(event, _CTX)
 
         assert response['statusCode'] == 200
-        response_body = json.loads(response['body'])
+        response_body = json_loads(response['body'])
         assert 'levels' in response_body
 
-    @mock_aws
-    def test_zero_values(self, aws_credentials, dynamodb_tables):
+    def test_zero_values(self, db_service, dynamodb_tables):
         """Test request with zero values for exercises."""
-        event = {
-            'body': json.dumps({
-                "user_id": "user123",
-                "pushups_type": "classic",
-                "results": {
-                    "max_push_ups": 0,
-                    "max_squats": 0,
-                    "max_reverse_snow_angels_45s": 0,
-                    "plank_max_time_seconds": 0,
-                    "mountain_climbers_45s": 0
-                }
-            })
-        }
-        context = Mock()
-
-        response = lambda_handler(event, context)
+        event = {'body': _ZERO_VALUES_BODY}
+        response = lambda_handler(event, _CTX)
 
         assert response['statusCode'] == 200
-        response_body = json.loads(response['body'])
+        response_body = json_loads(response['body'])
 
         # All zeros should result in BEGINNER levels
         levels = response_body['levels']
@@ -275,49 +165,34 @@ class TestLambdaHandler:
         assert levels['per_category']['CORE'] == 'BEGINNER'
         assert levels['per_category']['COND'] == 'BEGINNER'
 
-    def test_missing_pushups_type(self):
-        """Test request without pushups_type."""
-        event = {
-            'body': json.dumps({
-                "user_id": "user123",
-                "results": {
-                    "max_push_ups": 50,
-                    "max_squats": 100,
-                    "max_reverse_snow_angels_45s": 30,
-                    "plank_max_time_seconds": 120,
-                    "mountain_climbers_45s": 80
-                }
-            })
-        }
-        context = Mock()
-
-        response = lambda_handler(event, context)
+    def test_stdlib_json_fallback(self, stdlib_json, no_db):
+        """Test the handler end to end with the stdlib json fallback."""
+        assert _lh._json_loads is json.loads
 
+        response = lambda_handler({'body': _VALID_BODY}, _CTX)
+        assert response['statusCode'] == 200
+        assert json.loads(response['body'])['levels']['global_level'] == 'ADVANCED'
+        assert len(no_db) == 1
+
+        response = lambda_handler({'body': 'not-valid-json{'}, _CTX)
         assert response['statusCode'] == 400
-        body = json.loads(response['body'])
-        assert 'error' in body
-        assert 'pushups_type' in body['error']
-
-    def test_invalid_pushups_type(self):
-        """Test request with invalid pushups_type."""
-        event = {
-            'body': json.dumps({
-                "user_id": "user123",
-                "pushups_type": "invalid_type",
-                "results": {
-                    "max_push_ups": 50,
-                    "max_squats": 100,
-                    "max_reverse_snow_angels_45s": 30,
-                    "plank_max_time_seconds": 120,
-                    "mountain_climbers_45s": 80
-                }
-            })
-        }
-        context = Mock()
-
-        response = lambda_handler(event, context)
+        assert response['body'] == json.dumps({'error': 'Invalid JSON in request body'})
+
+    def test_stdlib_json_accepts_out_of_range_int(self, stdlib_json, no_db):
+        """Test that the stdlib parser keeps integers beyond 64 bits as int, so they validate."""
+        event = _mutated_event(lambda p: p['results'].update(max_squats=2 ** 64))
+        response = lambda_handler(event, _CTX)
+
+        assert response['statusCode'] == 200
+        assert no_db[0][0]['max_squats'] == 2 ** 64
+
+    def test_orjson_rejects_out_of_range_int(self, no_db):
+        """Test that orjson parses integers beyond 64 bits as floats, which fail validation."""
+        pytest.importorskip('orjson')
+        event = _mutated_event(lambda p: p['results'].update(max_squats=2 ** 64))
+        response = lambda_handler(event, _CTX)
 
         assert response['statusCode'] == 400
-        body = json.loads(response['body'])
-        assert 'error' in body
-        assert 'pushups_type' in body['error']
\ No newline at end of file
+        # orjson encodes compactly, unlike json.dumps
+        assert response['body'] == '{"error":"max_squats must be an integer"}'
+        assert no_db == []
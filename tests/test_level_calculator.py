@@ -1,4 +1,6 @@
 import pytest
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
 from level_calculator import (
     Level,
     TestResults,
@@ -8,78 +10,107 @@ from level_calculator import (
     level_cond_from_mountain_climbers,
     level_push_from_pushups,
     compute_levels,
+    compute_levels_from_mapping,
 )
 
 
+LOWER_CASES = [
+    (-5, Level.BEGINNER),
+    (10, Level.BEGINNER),
+    (20, Level.BEGINNER),
+    (21, Level.INTERMEDIATE),
+    (40, Level.INTERMEDIATE),
+    (41, Level.ADVANCED),
+    (100, Level.ADVANCED),
+]
+
+PULL_CASES = [
+    (-1, Level.BEGINNER),
+    (5, Level.BEGINNER),
+    (10, Level.BEGINNER),
+    (11, Level.INTERMEDIATE),
+    (20, Level.INTERMEDIATE),
+    (21, Level.ADVANCED),
+    (50, Level.ADVANCED),
+]
+
+CORE_CASES = [
+    (-10.5, Level.BEGINNER),
+    (float("nan"), Level.BEGINNER),
+    (15, Level.BEGINNER),
+    (29, Level.BEGINNER),
+    (30, Level.INTERMEDIATE),
+    (74, Level.INTERMEDIATE),
+    (75, Level.ADVANCED),
+    (120, Level.ADVANCED),
+]
+
+COND_CASES = [
+    (-3, Level.BEGINNER),
+    (15, Level.BEGINNER),
+    (29, Level.BEGINNER),
+    (30, Level.INTERMEDIATE),
+    (60, Level.INTERMEDIATE),
+    (61, Level.ADVANCED),
+    (100, Level.ADVANCED),
+]
+
+PUSH_CASES = [
+    # Zero or negative reps are always BEGINNER
+    ("classic", 0, Level.BEGINNER),
+    ("knee", 0, Level.BEGINNER),
+    ("wall", 0, Level.BEGINNER),
+    ("classic", -2, Level.BEGINNER),
+    # Wall
+    ("wall", 1, Level.BEGINNER),
+    ("wall", 10, Level.BEGINNER),
+    ("wall", 50, Level.BEGINNER),
+    # Incline
+    ("incline", 1, Level.BEGINNER),
+    ("incline", 10, Level.BEGINNER),
+    ("incline", 50, Level.BEGINNER),
+    # Knee
+    ("knee", 1, Level.INTERMEDIATE),
+    ("knee", 10, Level.INTERMEDIATE),
+    ("knee", 50, Level.INTERMEDIATE),
+    # Classic
+    ("classic", 1, Level.INTERMEDIATE),
+    ("classic", 10, Level.INTERMEDIATE),
+    ("classic", 11, Level.ADVANCED),
+    ("classic", 50, Level.ADVANCED),
+    # Variant names are matched case- and whitespace-insensitively
+    (" Classic ", 11, Level.ADVANCED),
+    ("KNEE", 5, Level.INTERMEDIATE),
+]
+
+
 class TestLevelFunctions:
     """Test individual level calculation functions."""
 
-    def test_level_lower_from_squats(self):
+    @pytest.mark.parametrize("reps,expected", LOWER_CASES)
+    def test_level_lower_from_squats(self, reps, expected):
         """Test squat level calculation."""
-        assert level_lower_from_squats(10) == Level.BEGINNER
-        assert level_lower_from_squats(20) == Level.BEGINNER
-        assert level_lower_from_squats(21) == Level.INTERMEDIATE
-        assert level_lower_from_squats(40) == Level.INTERMEDIATE
-        assert level_lower_from_squats(41) == Level.ADVANCED
-        assert level_lower_from_squats(100) == Level.ADVANCED
-
-    def test_level_pull_from_reverse_snow_angels(self):
+        assert level_lower_from_squats(reps) == expected
+
+    @pytest.mark.parametrize("reps,expected", PULL_CASES)
+    def test_level_pull_from_reverse_snow_angels(self, reps, expected):
         """Test reverse snow angels level calculation."""
-        assert level_pull_from_reverse_snow_angels(5) == Level.BEGINNER
-        assert level_pull_from_reverse_snow_angels(10) == Level.BEGINNER
-        assert level_pull_from_reverse_snow_angels(11) == Level.INTERMEDIATE
-        assert level_pull_from_reverse_snow_angels(20) == Level.INTERMEDIATE
-        assert level_pull_from_reverse_snow_angels(21) == Level.ADVANCED
-        assert level_pull_from_reverse_snow_angels(50) == Level.ADVANCED
-
-    def test_level_core_from_plank(self):
+        assert level_pull_from_reverse_snow_angels(reps) == expected
+
+    @pytest.mark.parametrize("seconds,expected", CORE_CASES)
+    def test_level_core_from_plank(self, seconds, expected):
         """Test plank level calculation."""
-        assert level_core_from_plank(15) == Level.BEGINNER
-        assert level_core_from_plank(29) == Level.BEGINNER
-        assert level_core_from_plank(30) == Level.INTERMEDIATE
-        assert level_core_from_plank(74) == Level.INTERMEDIATE
-        assert level_core_from_plank(75) == Level.ADVANCED
-        assert level_core_from_plank(120) == Level.ADVANCED
-
-    def test_level_cond_from_mountain_climbers(self):
+        assert level_core_from_plank(seconds) == expected
+
+    @pytest.mark.parametrize("reps,expected", COND_CASES)
+    def test_level_cond_from_mountain_climbers(self, reps, expected):
         """Test mountain climbers level calculation."""
-        assert level_cond_from_mountain_climbers(15) == Level.BEGINNER
-        assert level_cond_from_mountain_climbers(29) == Level.BEGINNER
-        assert level_cond_from_mountain_climbers(30) == Level.INTERMEDIATE
-        assert level_cond_from_mountain_climbers(60) == Level.INTERMEDIATE
-        assert level_cond_from_mountain_climbers(61) == Level.ADVANCED
-        assert level_cond_from_mountain_climbers(100) == Level.ADVANCED
-
-    def test_level_push_from_pushups_zero_reps(self):
-        """Test that zero reps always returns BEGINNER."""
-        assert level_push_from_pushups("classic", 0) == Level.BEGINNER
-        assert level_push_from_pushups("knee", 0) == Level.BEGINNER
-        assert level_push_from_pushups("wall", 0) == Level.BEGINNER
-
-    def test_level_push_from_pushups_wall(self):
-        """Test wall push-ups level calculation."""
-        assert level_push_from_pushups("wall", 1) == Level.BEGINNER
-        assert level_push_from_pushups("wall", 10) == Level.BEGINNER
-        assert level_push_from_pushups("wall", 50) == Level.BEGINNER
-
-    def test_level_push_from_pushups_incline(self):
-        """Test incline push-ups level calculation."""
-        assert level_push_from_pushups("incline", 1) == Level.BEGINNER
-        assert level_push_from_pushups("incline", 10) == Level.BEGINNER
-        assert level_push_from_pushups("incline", 50) == Level.BEGINNER
-
-    def test_level_push_from_pushups_knee(self):
-        """Test knee push-ups level calculation."""
-        assert level_push_from_pushups("knee", 1) == Level.INTERMEDIATE
-        assert level_push_from_pushups("knee", 10) == Level.INTERMEDIATE
-        assert level_push_from_pushups("knee", 50) == Level.INTERMEDIATE
-
-    def test_level_push_from_pushups_classic(self):
-        """Test classic push-ups level calculation."""
-        assert level_push_from_pushups("classic", 1) == Level.INTERMEDIATE
-        assert level_push_from_pushups("classic", 10) == Level.INTERMEDIATE
-        assert level_push_from_pushups("classic", 11) == Level.ADVANCED
-        assert level_push_from_pushups("classic", 50) == Level.ADVANCED
+        assert level_cond_from_mountain_climbers(reps) == expected
+
+    @pytest.mark.parametrize("variant,reps,expected", PUSH_CASES)
+    def test_level_push_from_pushups(self, variant, reps, expected):
+        """Test push-ups level calculation for every variant."""
+        assert level_push_from_pushups(variant, reps) == expected
 
     def test_level_push_from_pushups_invalid_variant(self):
         """Test that invalid variant raises ValueError."""
@@ -87,108 +118,122 @@ class TestLevelFunctions:
             level_push_from_pushups("invalid", 10)
 
 
-class TestComputeLevels:
-    """Test the complete level computation."""
+@dataclass(frozen=True)
+class Scenario:
+    """A compute_levels input with the outputs it must produce (None = not checked)."""
+    id: str
+    inputs: Dict[str, Any]
+    global_level: Optional[str] = None
+    per_category: Dict[str, str] = field(default_factory=dict)
+    raw_avg_points: Optional[float] = None
+
+
+def _all(level: str) -> Dict[str, str]:
+    return dict.fromkeys(("LOWER", "PUSH", "PULL", "CORE", "COND"), level)
+
+
+SCENARIOS = [
+    Scenario(
+        id="all_beginner",
+        inputs=dict(max_squats=10, pushups_type="wall", max_push_ups=5,
+                    max_reverse_snow_angels_45s=5, plank_max_time_seconds=20, mountain_climbers_45s=15),
+        global_level="BEGINNER",
+        per_category=_all("BEGINNER"),
+    ),
+    Scenario(
+        id="all_advanced",
+        inputs=dict(max_squats=50, pushups_type="classic", max_push_ups=15,
+                    max_reverse_snow_angels_45s=25, plank_max_time_seconds=90, mountain_climbers_45s=70),
+        global_level="ADVANCED",
+        per_category=_all("ADVANCED"),
+    ),
+    Scenario(
+        id="mixed_intermediate",
+        inputs=dict(max_squats=25, pushups_type="knee", max_push_ups=10,
+                    max_reverse_snow_angels_45s=15, plank_max_time_seconds=50, mountain_climbers_45s=45),
+        global_level="INTERMEDIATE",
+    ),
+    # Corrective rule: BEGINNER + ADVANCED caps the global level at INTERMEDIATE
+    Scenario(
+        id="corrective_rule_beginner_and_advanced",
+        inputs=dict(max_squats=5, pushups_type="classic", max_push_ups=20,
+                    max_reverse_snow_angels_45s=50, plank_max_time_seconds=100, mountain_climbers_45s=80),
+        global_level="INTERMEDIATE",
+        per_category={"LOWER": "BEGINNER", "PUSH": "ADVANCED"},
+    ),
+    Scenario(
+        id="real_world_example",
+        inputs=dict(max_squats=30, pushups_type="classic", max_push_ups=8,
+                    max_reverse_snow_angels_45s=12, plank_max_time_seconds=45, mountain_climbers_45s=40),
+        global_level="INTERMEDIATE",
+        per_category=_all("INTERMEDIATE"),
+    ),
+    # Average = (1 + 3 + 2 + 2 + 2) / 5 = 10 / 5 = 2.0
+    Scenario(
+        id="average_points_calculation",
+        inputs=dict(max_squats=10, pushups_type="classic", max_push_ups=15,
+                    max_reverse_snow_angels_45s=15, plank_max_time_seconds=50, mountain_climbers_45s=45),
+        raw_avg_points=2.0,
+    ),
+    # Mixed levels without both extremes round the average half-up
+    Scenario(
+        id="rounds_1_2_down_to_beginner",
+        inputs=dict(max_squats=25, pushups_type="wall", max_push_ups=5,
+                    max_reverse_snow_angels_45s=5, plank_max_time_seconds=20, mountain_climbers_45s=15),
+        global_level="BEGINNER",
+        raw_avg_points=1.2,
+    ),
+    Scenario(
+        id="rounds_1_6_up_to_intermediate",
+        inputs=dict(max_squats=25, pushups_type="knee", max_push_ups=5,
+                    max_reverse_snow_angels_45s=15, plank_max_time_seconds=20, mountain_climbers_45s=15),
+        global_level="INTERMEDIATE",
+        raw_avg_points=1.6,
+    ),
+    Scenario(
+        id="rounds_2_4_down_to_intermediate",
+        inputs=dict(max_squats=50, pushups_type="classic", max_push_ups=15,
+                    max_reverse_snow_angels_45s=15, plank_max_time_seconds=50, mountain_climbers_45s=45),
+        global_level="INTERMEDIATE",
+        raw_avg_points=2.4,
+    ),
+    Scenario(
+        id="rounds_2_6_up_to_advanced",
+        inputs=dict(max_squats=50, pushups_type="classic", max_push_ups=15,
+                    max_reverse_snow_angels_45s=25, plank_max_time_seconds=50, mountain_climbers_45s=45),
+        global_level="ADVANCED",
+        raw_avg_points=2.6,
+    ),
+]
 
-    def test_all_beginner(self):
-        """Test all exercises at beginner level."""
-        results = TestResults(
-            max_squats=10,
-            pushups_type="wall",
-            max_push_ups=5,
-            max_reverse_snow_angels_45s=5,
-            plank_max_time_seconds=20,
-            mountain_climbers_45s=15,
-        )
-        levels = compute_levels(results)
-
-        assert levels["global_level"] == "BEGINNER"
-        assert levels["per_category"]["LOWER"] == "BEGINNER"
-        assert levels["per_category"]["PUSH"] == "BEGINNER"
-        assert levels["per_category"]["PULL"] == "BEGINNER"
-        assert levels["per_category"]["CORE"] == "BEGINNER"
-        assert levels["per_category"]["COND"] == "BEGINNER"
-
-    def test_all_advanced(self):
-        """Test all exercises at advanced level."""
-        results = TestResults(
-            max_squats=50,
-            pushups_type="classic",
-            max_push_ups=15,
-            max_reverse_snow_angels_45s=25,
-            plank_max_time_seconds=90,
-            mountain_climbers_45s=70,
-        )
-        levels = compute_levels(results)
-
-        assert levels["global_level"] == "ADVANCED"
-        assert levels["per_category"]["LOWER"] == "ADVANCED"
-        assert levels["per_category"]["PUSH"] == "ADVANCED"
-        assert levels["per_category"]["PULL"] == "ADVANCED"
-        assert levels["per_category"]["CORE"] == "ADVANCED"
-        assert levels["per_category"]["COND"] == "ADVANCED"
-
-    def test_mixed_intermediate(self):
-        """Test mixed levels averaging to intermediate."""
-        results = TestResults(
-            max_squats=25,
-            pushups_type="knee",
-            max_push_ups=10,
-            max_reverse_snow_angels_45s=15,
-            plank_max_time_seconds=50,
-            mountain_climbers_45s=45,
-        )
-        levels = compute_levels(results)
 
-        assert levels["global_level"] == "INTERMEDIATE"
+class TestComputeLevels:
+    """Test the complete level computation."""
 
-    def test_corrective_rule_beginner_and_advanced(self):
-        """Test corrective rule: BEGINNER + ADVANCED = INTERMEDIATE globally."""
-        results = TestResults(
-            max_squats=5,  # BEGINNER
-            pushups_type="classic",
-            max_push_ups=20,  # ADVANCED
-            max_reverse_snow_angels_45s=50,  # ADVANCED
-            plank_max_time_seconds=100,  # ADVANCED
-            mountain_climbers_45s=80,  # ADVANCED
-        )
-        levels = compute_levels(results)
-
-        # Should be capped at INTERMEDIATE due to beginner + advanced mix
-        assert levels["global_level"] == "INTERMEDIATE"
+    @pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda s: s.id)
+    def test_compute_levels(self, scenario):
+        """Test compute_levels against each scenario's expected outputs."""
+        levels = compute_levels(TestResults(**scenario.inputs))
+
+        if scenario.global_level is not None:
+            assert levels["global_level"] == scenario.global_level
+        for category, expected in scenario.per_category.items():
+            assert levels["per_category"][category] == expected
+        if scenario.raw_avg_points is not None:
+            assert levels["global_level_raw_avg_points"] == scenario.raw_avg_points
+
+    def test_compute_levels_from_mapping(self):
+        """Test that computing from a results mapping matches compute_levels."""
+        results = {
+            "max_squats": 10,
+            "max_push_ups": 15,
+            "max_reverse_snow_angels_45s": 15,
+            "plank_max_time_seconds": 50,
+            "mountain_climbers_45s": 45,
+        }
+        levels = compute_levels_from_mapping(results, "classic")
+
+        assert levels == compute_levels(TestResults(pushups_type="classic", **results))
         assert levels["per_category"]["LOWER"] == "BEGINNER"
         assert levels["per_category"]["PUSH"] == "ADVANCED"
-
-    def test_real_world_example(self):
-        """Test with realistic test results."""
-        results = TestResults(
-            max_squats=30,
-            pushups_type="classic",
-            max_push_ups=8,
-            max_reverse_snow_angels_45s=12,
-            plank_max_time_seconds=45,
-            mountain_climbers_45s=40,
-        )
-        levels = compute_levels(results)
-
-        assert levels["per_category"]["LOWER"] == "INTERMEDIATE"  # 30 squats
-        assert levels["per_category"]["PUSH"] == "INTERMEDIATE"  # classic 8 reps
-        assert levels["per_category"]["PULL"] == "INTERMEDIATE"  # 12 angels
-        assert levels["per_category"]["CORE"] == "INTERMEDIATE"  # 45s plank
-        assert levels["per_category"]["COND"] == "INTERMEDIATE"  # 40 climbers
         assert levels["global_level"] == "INTERMEDIATE"
-
-    def test_average_points_calculation(self):
-        """Test that raw average points are calculated correctly."""
-        results = TestResults(
-            max_squats=10,  # BEGINNER = 1 point
-            pushups_type="classic",
-            max_push_ups=15,  # ADVANCED = 3 points
-            max_reverse_snow_angels_45s=15,  # INTERMEDIATE = 2 points
-            plank_max_time_seconds=50,  # INTERMEDIATE = 2 points
-            mountain_climbers_45s=45,  # INTERMEDIATE = 2 points
-        )
-        levels = compute_levels(results)
-
-        # Average = (1 + 3 + 2 + 2 + 2) / 5 = 10 / 5 = 2.0
-        assert levels["global_level_raw_avg_points"] == 2.0
\ No newline at end of file
@@ -1,5 +1,6 @@
 import pytest
 from validator import validate_fitness_test_request
+from tests._payloads import VALID_PAYLOAD, mutated_payload
 
 
 class TestValidateFitnessTestRequest:
@@ -7,197 +8,114 @@ class TestValidateFitnessTestRequest:
 
     def test_valid_request(self):
         """Test validation with a valid request."""
-        body = {
-            "user_id": "user123",
-            "pushups_type": "classic",
-            "results": {
-                "max_push_ups": 50,
-                "max_squats": 100,
-                "max_reverse_snow_angels_45s": 30,
-                "plank_max_time_seconds": 120,
-                "mountain_climbers_45s": 80
-            }
-        }
-        is_valid, error = validate_fitness_test_request(body)
+        is_valid, error = validate_fitness_test_request(VALID_PAYLOAD)
         assert is_valid is True
         assert error == ""
 
     def test_missing_user_id(self):
         """Test validation when user_id is missing."""
-        body = {
-            "pushups_type": "classic",
-            "results": {
-                "max_push_ups": 50,
-                "max_squats": 100,
-                "max_reverse_snow_angels_45s": 30,
-                "plank_max_time_seconds": 120,
-                "mountain_climbers_45s": 80
-            }
-        }
+        body = mutated_payload(lambda p: p.pop("user_id"))
         is_valid, error = validate_fitness_test_request(body)
         assert is_valid is False
         assert "user_id" in error
 
+    def test_non_object_body(self):
+        """Test validation when the body is not a JSON object."""
+        is_valid, error = validate_fitness_test_request(["user_id", "results"])
+        assert is_valid is False
+        assert "object" in error
+
     def test_missing_results(self):
         """Test validation when results object is missing."""
-        body = {
-            "user_id": "user123",
-            "pushups_type": "classic"
-        }
+        body = mutated_payload(lambda p: p.pop("results"))
         is_valid, error = validate_fitness_test_request(body)
         assert is_valid is False
         assert "results" in error
 
     def test_empty_user_id(self):
         """Test validation with empty user_id."""
-        body = {
-            "user_id": "",
-            "pushups_type": "classic",
-            "results": {
-                "max_push_ups": 50,
-                "max_squats": 100,
-                "max_reverse_snow_angels_45s": 30,
-                "plank_max_time_seconds": 120,
-                "mountain_climbers_45s": 80
-            }
-        }
+        body = mutated_payload(lambda p: p.update(user_id=""))
+        is_valid, error = validate_fitness_test_request(body)
+        assert is_valid is False
+        assert "user_id" in error
+
+    def test_whitespace_user_id(self):
+        """Test validation with a whitespace-only user_id."""
+        body = mutated_payload(lambda p: p.update(user_id="   "))
         is_valid, error = validate_fitness_test_request(body)
         assert is_valid is False
         assert "user_id" in error
 
     def test_missing_result_field(self):
         """Test validation when a result field is missing."""
-        body = {
-            "user_id": "user123",
-            "pushups_type": "classic",
-            "results": {
-                "max_push_ups": 50,
-                "max_squats": 100,
-                "max_reverse_snow_angels_45s": 30,
-                "plank_max_time_seconds": 120
-                # mountain_climbers_45s is missing
-            }
-        }
+        body = mutated_payload(lambda p: p["results"].pop("mountain_climbers_45s"))
         is_valid, error = validate_fitness_test_request(body)
         assert is_valid is False
         assert "mountain_climbers_45s" in error
 
+    def test_invalid_field_reported_before_later_missing_field(self):
+        """Test that result fields are checked in order, one at a time."""
+        def mutate(p):
+            p["results"]["max_push_ups"] = -5
+            del p["results"]["mountain_climbers_45s"]
+
+        is_valid, error = validate_fitness_test_request(mutated_payload(mutate))
+        assert is_valid is False
+        assert error == "max_push_ups must be non-negative"
+
     def test_non_integer_result_value(self):
         """Test validation with non-integer result value."""
-        body = {
-            "user_id": "user123",
-            "pushups_type": "classic",
-            "results": {
-                "max_push_ups": "fifty",
-                "max_squats": 100,
-                "max_reverse_snow_angels_45s": 30,
-                "plank_max_time_seconds": 120,
-                "mountain_climbers_45s": 80
-            }
-        }
+        body = mutated_payload(lambda p: p["results"].update(max_push_ups="fifty"))
         is_valid, error = validate_fitness_test_request(body)
         assert is_valid is False
         assert "integer" in error
 
+    def test_boolean_result_value(self):
+        """Test validation rejects a boolean result value."""
+        body = mutated_payload(lambda p: p["results"].update(max_push_ups=True))
+        is_valid, error = validate_fitness_test_request(body)
+        assert is_valid is False
+        assert "max_push_ups must be an integer" in error
+
     def test_negative_result_value(self):
         """Test validation with negative result value."""
-        body = {
-            "user_id": "user123",
-            "pushups_type": "classic",
-            "results": {
-                "max_push_ups": -5,
-                "max_squats": 100,
-                "max_reverse_snow_angels_45s": 30,
-                "plank_max_time_seconds": 120,
-                "mountain_climbers_45s": 80
-            }
-        }
+        body = mutated_payload(lambda p: p["results"].update(max_push_ups=-5))
         is_valid, error = validate_fitness_test_request(body)
         assert is_valid is False
         assert "non-negative" in error
 
     def test_zero_values_allowed(self):
         """Test that zero values are valid."""
-        body = {
-            "user_id": "user123",
-            "pushups_type": "classic",
-            "results": {
-                "max_push_ups": 0,
-                "max_squats": 0,
-                "max_reverse_snow_angels_45s": 0,
-                "plank_max_time_seconds": 0,
-                "mountain_climbers_45s": 0
-            }
-        }
+        body = mutated_payload(lambda p: p.update(results=dict.fromkeys(p["results"], 0)))
         is_valid, error = validate_fitness_test_request(body)
         assert is_valid is True
         assert error == ""
 
     def test_missing_pushups_type(self):
         """Test validation when pushups_type is missing."""
-        body = {
-            "user_id": "user123",
-            "results": {
-                "max_push_ups": 50,
-                "max_squats": 100,
-                "max_reverse_snow_angels_45s": 30,
-                "plank_max_time_seconds": 120,
-                "mountain_climbers_45s": 80
-            }
-        }
+        body = mutated_payload(lambda p: p.pop("pushups_type"))
         is_valid, error = validate_fitness_test_request(body)
         assert is_valid is False
         assert "pushups_type" in error
 
     def test_invalid_pushups_type(self):
         """Test validation with invalid pushups_type value."""
-        body = {
-            "user_id": "user123",
-            "pushups_type": "invalid_type",
-            "results": {
-                "max_push_ups": 50,
-                "max_squats": 100,
-                "max_reverse_snow_angels_45s": 30,
-                "plank_max_time_seconds": 120,
-                "mountain_climbers_45s": 80
-            }
-        }
+        body = mutated_payload(lambda p: p.update(pushups_type="invalid_type"))
         is_valid, error = validate_fitness_test_request(body)
         assert is_valid is False
         assert "pushups_type must be one of" in error
 
     def test_non_string_pushups_type(self):
         """Test validation with non-string pushups_type."""
-        body = {
-            "user_id": "user123",
-            "pushups_type": 123,
-            "results": {
-                "max_push_ups": 50,
-                "max_squats": 100,
-                "max_reverse_snow_angels_45s": 30,
-                "plank_max_time_seconds": 120,
-                "mountain_climbers_45s": 80
-            }
-        }
+        body = mutated_payload(lambda p: p.update(pushups_type=123))
         is_valid, error = validate_fitness_test_request(body)
         assert is_valid is False
         assert "pushups_type must be a string" in error
 
-    def test_valid_pushups_types(self):
-        """Test validation with all valid pushups_type values."""
-        valid_types = ["classic", "knee", "incline", "wall"]
-        for pushups_type in valid_types:
-            body = {
-                "user_id": "user123",
-                "pushups_type": pushups_type,
-                "results": {
-                    "max_push_ups": 50,
-                    "max_squats": 100,
-                    "max_reverse_snow_angels_45s": 30,
-                    "plank_max_time_seconds": 120,
-                    "mountain_climbers_45s": 80
-                }
-            }
-            is_valid, error = validate_fitness_test_request(body)
-            assert is_valid is True
-            assert error == ""
\ No newline at end of file
+    @pytest.mark.parametrize("pushups_type", ["classic", "knee", "incline", "wall"])
+    def test_valid_pushups_types(self, pushups_type):
+        """Test validation with each valid pushups_type value."""
+        body = mutated_payload(lambda p: p.update(pushups_type=pushups_type))
+        is_valid, error = validate_fitness_test_request(body)
+        assert is_valid is True
+        assert error == ""
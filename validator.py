@@ -1,5 +1,38 @@
+from operator import itemgetter
 from typing import Tuple
 
+# Result for a valid request; tuples are immutable, so one instance is shared
+_OK = (True, "")
+
+# Sentinel for a field absent from the request body
+_MISSING = object()
+
+# Allowed push-up variants; the error message lists them in this order
+_PUSHUPS_TYPES_ORDER = ('classic', 'knee', 'incline', 'wall')
+_PUSHUPS_TYPES = frozenset(_PUSHUPS_TYPES_ORDER)
+_PUSHUPS_TYPES_ERROR = f"pushups_type must be one of: {', '.join(_PUSHUPS_TYPES_ORDER)}"
+
+# Required result fields, in the order they are checked
+_REQUIRED_RESULT_FIELDS = (
+    'max_push_ups',
+    'max_squats',
+    'max_reverse_snow_angels_45s',
+    'plank_max_time_seconds',
+    'mountain_climbers_45s'
+)
+_get_result_values = itemgetter(*_REQUIRED_RESULT_FIELDS)
+
+# Error messages per result field, built once:
+# (missing, not an integer, negative)
+_RESULT_FIELD_ERRORS = {
+    field: (
+        f"Missing required result field: {field}",
+        f"{field} must be an integer",
+        f"{field} must be non-negative",
+    )
+    for field in _REQUIRED_RESULT_FIELDS
+}
+
 
 def validate_fitness_test_request(body: dict) -> Tuple[bool, str]:
     """
@@ -11,50 +44,74 @@ def validate_fitness_test_request(body: dict) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    # Check required top-level fields
-    if 'user_id' not in body:
-        return False, "Missing required field: user_id"
+    # Fast path: a well-formed body passes one compound check; anything
+    # missing, mistyped or out of range falls through to the diagnostic
+    # checks below, which find the specific error to report
+    try:
+        user_id = body['user_id']
+        pushups_type = body['pushups_type']
+        results = body['results']
+        v1, v2, v3, v4, v5 = _get_result_values(results)
+    except (KeyError, TypeError):
+        pass
+    else:
+        if (
+            isinstance(body, dict) and isinstance(results, dict)
+            and type(user_id) is str and user_id and not user_id.isspace()
+            and isinstance(pushups_type, str) and pushups_type in _PUSHUPS_TYPES
+            and type(v1) is int and v1 >= 0
+            and type(v2) is int and v2 >= 0
+            and type(v3) is int and v3 >= 0
+            and type(v4) is int and v4 >= 0
+            and type(v5) is int and v5 >= 0
+        ):
+            return _OK
 
-    if 'results' not in body:
-        return False, "Missing required field: results"
+    return _find_validation_error(body)
+
+
+def _find_validation_error(body: dict) -> Tuple[bool, str]:
+    if not isinstance(body, dict):
+        return False, "Request body must be an object"
 
-    if 'pushups_type' not in body:
+    # Bind each top-level field once; missing fields are reported in the
+    # order user_id, results, pushups_type
+    user_id = body.get('user_id', _MISSING)
+    results = body.get('results', _MISSING)
+    pushups_type = body.get('pushups_type', _MISSING)
+    if user_id is _MISSING:
+        return False, "Missing required field: user_id"
+    if results is _MISSING:
+        return False, "Missing required field: results"
+    if pushups_type is _MISSING:
         return False, "Missing required field: pushups_type"
 
     # Validate user_id
-    if not isinstance(body['user_id'], str) or not body['user_id'].strip():
+    if type(user_id) is not str or not user_id or user_id.isspace():
         return False, "user_id must be a non-empty string"
 
     # Validate pushups_type
-    allowed_pushups_types = ['classic', 'knee', 'incline', 'wall']
-    if not isinstance(body['pushups_type'], str):
+    if not isinstance(pushups_type, str):
         return False, "pushups_type must be a string"
-    if body['pushups_type'] not in allowed_pushups_types:
-        return False, f"pushups_type must be one of: {', '.join(allowed_pushups_types)}"
+    if pushups_type not in _PUSHUPS_TYPES:
+        return False, _PUSHUPS_TYPES_ERROR
 
     # Validate results object
-    results = body['results']
     if not isinstance(results, dict):
         return False, "results must be an object"
 
-    # Required result fields
-    required_fields = [
-        'max_push_ups',
-        'max_squats',
-        'max_reverse_snow_angels_45s',
-        'plank_max_time_seconds',
-        'mountain_climbers_45s'
-    ]
-
-    for field in required_fields:
-        if field not in results:
-            return False, f"Missing required result field: {field}"
+    # One ordered pass with a single lookup per field, so the first bad
+    # field in field order is the one reported
+    for field in _REQUIRED_RESULT_FIELDS:
+        value = results.get(field, _MISSING)
+        if value is _MISSING:
+            return False, _RESULT_FIELD_ERRORS[field][0]
 
-        value = results[field]
-        if not isinstance(value, int):
-            return False, f"{field} must be an integer"
+        # type() rather than isinstance() so booleans are rejected
+        if type(value) is not int:
+            return False, _RESULT_FIELD_ERRORS[field][1]
 
         if value < 0:
-            return False, f"{field} must be non-negative"
+            return False, _RESULT_FIELD_ERRORS[field][2]
 
-    return True, ""
\ No newline at end of file
+    return _OK
\ No newline at end of file